@@ -6,12 +6,12 @@ Reads configuration from config.yaml and captures transcripts for all enabled vi
 """
 
 import asyncio
+import json
+import re
+import shutil
 import sys
-import yaml
 from pathlib import Path
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 from datetime import datetime
 
 # Add the src directory to the path so we can import our modules
@@ -21,9 +21,25 @@ from social_capture.youtube_client import YouTubeClient
 
 console = Console()
 
+try:
+    # uvloop is a drop-in libuv event loop, ~2x faster for asyncio I/O
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+
+# Strip anything that isn't a word character, whitespace or dash (compiled
+# once; runs in C instead of a per-character Python loop)
+_SAFE_NAME_RE = re.compile(r'[^\w\s\-]+')
+
 async def capture_youtube_videos():
     """Capture all YouTube videos from configuration."""
     
+    # Deferred imports: keep startup fast for --help/error paths
+    from social_capture.config_cache import load_config_data
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     # Load configuration
     config_path = Path(__file__).parent.parent / "config.yaml"
     if not config_path.exists():
@@ -31,8 +47,7 @@ async def capture_youtube_videos():
         console.print(f"Expected at: {config_path}")
         return False
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config_data(config_path)
     
     youtube_config = config.get('youtube', {})
     videos = youtube_config.get('videos', [])
@@ -60,73 +75,137 @@ async def capture_youtube_videos():
     output_dir = Path(__file__).parent.parent / "capture" / "youtube"
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    results = []
-    
+    # Bound concurrency so we don't hammer YouTube's transcript endpoint
+    sem = asyncio.Semaphore(int(youtube_config.get('concurrency', 6)))
+
+    # One timestamp per run: all output files share a run identifier and we
+    # avoid a clock syscall + strftime per video
+    run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    # Stream each result to a JSONL manifest as it completes instead of
+    # keeping everything in RAM; also gives crash-safe partial state
+    manifest_file = output_dir / f"run_{run_ts}.jsonl"
+    manifest = manifest_file.open('w', encoding='utf-8')
+
+    def _record(result):
+        manifest.write(json.dumps(result, default=str) + '\n')
+        manifest.flush()
+
+    # Dedupe: if the same video is configured twice (e.g. under different
+    # names), fetch its transcript once and copy the file for the duplicates.
+    # Per-video locks serialize concurrent tasks for the same ID.
+    seen = {}        # video_id -> output Path of the completed capture
+    seen_locks = {}  # video_id -> asyncio.Lock
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        
-        for i, video_config in enumerate(enabled_videos, 1):
+
+        async def _fetch_one(video_config, i):
+            """Capture a single video transcript and return its result dict."""
             video_name = video_config.get('name', f'Video {i}')
             video_url = video_config.get('url')
-            
+
             if not video_url:
                 console.print(f"⚠️  [yellow]Skipping {video_name}: No URL provided[/yellow]")
-                continue
-            
+                return {
+                    'name': video_name,
+                    'url': None,
+                    'status': 'skipped',
+                    'error': 'No URL provided'
+                }
+
             task = progress.add_task(f"Capturing: {video_name}", total=1)
-            
+
             try:
                 # Generate output filename
-                safe_name = "".join(c for c in video_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                safe_name = safe_name.replace(' ', '_')
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_file = output_dir / f"{safe_name}_{timestamp}.md"
-                
+                safe_name = _SAFE_NAME_RE.sub('', video_name).strip().replace(' ', '_')
+                output_file = output_dir / f"{safe_name}_{run_ts}.md"
+
                 # Capture transcript
                 languages = video_config.get('languages', ['en'])
-                success = await client.save_transcript(
-                    video_url=video_url,
-                    output_path=output_file,
-                    languages=languages,
-                    format_type="markdown"
-                )
-                
+                vid = client.extract_video_id(video_url)
+                lock = seen_locks.setdefault(vid, asyncio.Lock())
+                async with lock:
+                    if vid in seen:
+                        # Already fetched this video in this run
+                        await asyncio.to_thread(shutil.copyfile, seen[vid], output_file)
+                        success = True
+                        console.print(f"  ↺ [dim]{video_name}: duplicate of an already captured video, reusing transcript[/dim]")
+                    else:
+                        async with sem:
+                            success = await client.save_transcript(
+                                video_url=video_url,
+                                output_path=output_file,
+                                languages=languages,
+                                format_type="markdown"
+                            )
+                        if success and vid:
+                            seen[vid] = output_file
+
                 if success:
                     progress.update(task, completed=1)
-                    results.append({
+                    console.print(f"✅ [green]{video_name}[/green] → {output_file.name}")
+                    return {
                         'name': video_name,
                         'url': video_url,
                         'status': 'success',
                         'output_file': output_file
-                    })
-                    console.print(f"✅ [green]{video_name}[/green] → {output_file.name}")
+                    }
                 else:
-                    results.append({
+                    console.print(f"❌ [red]Failed: {video_name}[/red]")
+                    return {
                         'name': video_name,
                         'url': video_url,
                         'status': 'failed',
                         'error': 'Unknown error'
-                    })
-                    console.print(f"❌ [red]Failed: {video_name}[/red]")
-                
+                    }
+
             except Exception as e:
-                results.append({
+                console.print(f"❌ [red]Error capturing {video_name}: {str(e)}[/red]")
+                return {
                     'name': video_name,
                     'url': video_url,
                     'status': 'error',
                     'error': str(e)
-                })
-                console.print(f"❌ [red]Error capturing {video_name}: {str(e)}[/red]")
-            
-            progress.remove_task(task)
-    
+                }
+            finally:
+                progress.remove_task(task)
+
+        async def _run_one(video_config, i):
+            try:
+                result = await _fetch_one(video_config, i)
+            except Exception as e:
+                # _fetch_one handles its own errors; this is a last resort
+                result = {
+                    'name': video_config.get('name', f'Video {i}'),
+                    'url': video_config.get('url'),
+                    'status': 'error',
+                    'error': str(e)
+                }
+            _record(result)
+
+        tasks = [_run_one(v, i) for i, v in enumerate(enabled_videos, 1)]
+        await asyncio.gather(*tasks)
+
+    await client.aclose()
+    manifest.close()
+
+    # Build the summary from the manifest we just streamed out
+    results = [
+        json.loads(line)
+        for line in manifest_file.read_text(encoding='utf-8').splitlines()
+        if line
+    ]
+
     # Summary
+    from rich.table import Table
+
     console.print()
     console.print("📊 [bold]Capture Summary[/bold]")
-    
+
     table = Table()
     table.add_column("Video", style="cyan")
     table.add_column("Status", style="magenta")
@@ -137,7 +216,7 @@ async def capture_youtube_videos():
         status_text = f"{status_icon} {result['status']}"
         
         if result['status'] == 'success':
-            output_text = result['output_file'].name
+            output_text = Path(result['output_file']).name
         else:
             output_text = result.get('error', 'Unknown error')
         
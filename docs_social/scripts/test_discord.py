@@ -10,20 +10,30 @@ import sys
 import os
 from pathlib import Path
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
 # Add the src directory to the path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from social_capture.discord_client import DiscordClient
-from dotenv import load_dotenv
 
 console = Console()
 
+try:
+    # uvloop is a drop-in libuv event loop, ~2x faster for asyncio I/O
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+
 async def test_discord_connection():
     """Test Discord connection and basic functionality."""
     
+    # Deferred imports: keep startup fast for the quick error paths
+    from dotenv import load_dotenv
+    from rich.table import Table
+    from rich.panel import Panel
+
     # Load environment variables
     env_file = Path(__file__).parent.parent / ".env"
     if env_file.exists():
@@ -51,6 +61,7 @@ async def test_discord_connection():
     console.print()
     
     # Test connection
+    client = None
     try:
         client = DiscordClient(
             user_token=discord_token,
@@ -151,6 +162,9 @@ async def test_discord_connection():
         console.print(f"- Token length: {len(discord_token) if discord_token else 0}")
         console.print(f"- Token starts with: {discord_token[:20] + '...' if discord_token and len(discord_token) > 20 else 'N/A'}")
         return False
+    finally:
+        if client is not None:
+            await client.close()
 
 if __name__ == "__main__":
     try:
@@ -13,6 +13,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from social_capture.youtube_client import YouTubeClient
 
+try:
+    # uvloop is a drop-in libuv event loop, ~2x faster for asyncio I/O
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+
 
 async def test_youtube_transcript():
     """Test YouTube transcript extraction with a sample video."""
@@ -44,13 +52,13 @@ async def test_youtube_transcript():
         # Show first few segments
         print("📝 First few transcript segments:")
         print("-" * 30)
-        for i, segment in enumerate(result['transcript'][:3]):
-            start_time = segment['start']
+        transcript = result['transcript']
+        for start_time, text in zip(transcript['start'][:3], transcript['text'][:3]):
             minutes = int(start_time // 60)
             seconds = int(start_time % 60)
-            print(f"[{minutes:02d}:{seconds:02d}] {segment['text']}")
-        
-        if len(result['transcript']) > 3:
+            print(f"[{minutes:02d}:{seconds:02d}] {text}")
+
+        if len(transcript['text']) > 3:
             print("   ... (and more)")
         print()
         
@@ -1,15 +1,53 @@
 """Configuration management for social media capture tool."""
 
+import functools
 import os
 from pathlib import Path
 from typing import List, Optional, Union
 
 import yaml
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field, validator
+from dotenv import find_dotenv, load_dotenv
+from pydantic import BaseModel, ConfigDict, Field, validator
 
+try:
+    # LibYAML's C parser/emitter is ~5-15x faster than the pure-Python ones
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 
-class DiscordChannelConfig(BaseModel):
+try:
+    # Optional: msgspec's single-pass C YAML emitter for the save path
+    import msgspec.yaml
+except ImportError:
+    msgspec = None
+
+
+class _FrozenModel(BaseModel):
+    """
+    Base for config models: immutable after construction.
+
+    Nothing mutates a loaded config, so freezing lets the cached/
+    model_construct()-rebuilt trees be shared between callers without
+    defensive copies.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
+# Common canonical YouTube URL prefixes: startswith on a tuple stops at the
+# host instead of substring-scanning the whole URL. This is a fast path only —
+# other hosts (m./music.youtube.com, scheme-less links) fall through to the
+# substring check in the validator.
+_YT_PREFIXES = (
+    'https://www.youtube.com/watch',
+    'https://youtube.com/watch',
+    'http://www.youtube.com/watch',
+    'https://youtu.be/',
+    'http://youtu.be/',
+)
+
+
+class DiscordChannelConfig(_FrozenModel):
     """Configuration for a Discord channel or thread."""
     
     name: str
@@ -23,12 +61,12 @@ class DiscordChannelConfig(BaseModel):
     @validator('channel_id', 'thread_id', 'guild_id', 'last_message_id')
     def validate_ids(cls, v):
         """Validate Discord IDs are strings of digits."""
-        if v is not None and not (isinstance(v, str) and v.isdigit()):
+        if v is not None and not (type(v) is str and v.isdigit()):
             raise ValueError("Discord IDs must be strings of digits")
         return v
 
 
-class YouTubeVideoConfig(BaseModel):
+class YouTubeVideoConfig(_FrozenModel):
     """Configuration for a YouTube video."""
     
     name: str
@@ -41,24 +79,28 @@ class YouTubeVideoConfig(BaseModel):
     @validator('url')
     def validate_youtube_url(cls, v):
         """Validate YouTube URL format."""
-        if not ("youtube.com/watch" in v or "youtu.be/" in v):
+        if not (
+            v.startswith(_YT_PREFIXES)
+            or 'youtube.com/watch' in v
+            or 'youtu.be/' in v
+        ):
             raise ValueError("Must be a valid YouTube URL")
         return v
 
 
-class DiscordConfig(BaseModel):
+class DiscordConfig(_FrozenModel):
     """Discord configuration section."""
     
     channels: List[DiscordChannelConfig] = []
 
 
-class YouTubeConfig(BaseModel):
+class YouTubeConfig(_FrozenModel):
     """YouTube configuration section."""
     
     videos: List[YouTubeVideoConfig] = []
 
 
-class GlobalSettings(BaseModel):
+class GlobalSettings(_FrozenModel):
     """Global settings for the capture tool."""
     
     output_format: str = "markdown"
@@ -90,7 +132,7 @@ class GlobalSettings(BaseModel):
         return v
 
 
-class Config(BaseModel):
+class Config(_FrozenModel):
     """Main configuration class."""
     
     discord: DiscordConfig = DiscordConfig()
@@ -98,23 +140,34 @@ class Config(BaseModel):
     settings: GlobalSettings = GlobalSettings()
 
 
+# Load the discovered .env at most once per process; repeated
+# EnvironmentConfig() constructions then skip the filesystem walk entirely
+_dotenv_loaded = False
+
+
+@functools.lru_cache(maxsize=1)
+def _find_env_file() -> Optional[str]:
+    """Locate the nearest .env file from the current directory upwards."""
+    # python-dotenv's own walk; no per-parent Path allocation on our side
+    return find_dotenv(usecwd=True) or None
+
+
 class EnvironmentConfig:
     """Environment variable configuration."""
-    
+
     def __init__(self, env_file: Optional[str] = None):
         """Load environment variables from .env file."""
+        global _dotenv_loaded
         if env_file:
             load_dotenv(env_file)
-        else:
+        elif not _dotenv_loaded:
             # Try to find .env file in current directory or parent directories
-            current_dir = Path.cwd()
-            for parent in [current_dir] + list(current_dir.parents):
-                env_path = parent / ".env"
-                if env_path.exists():
-                    load_dotenv(env_path)
-                    break
-    
-    @property
+            env_path = _find_env_file()
+            if env_path:
+                load_dotenv(env_path)
+            _dotenv_loaded = True
+
+    @functools.cached_property
     def discord_user_token(self) -> str:
         """Get Discord user token from environment."""
         token = os.getenv("DISCORD_USER_TOKEN")
@@ -124,64 +177,95 @@ class EnvironmentConfig:
                 "Please copy .env.example to .env and configure it."
             )
         return token
-    
-    @property
+
+    @functools.cached_property
     def discord_rate_limit_delay(self) -> float:
         """Get Discord rate limit delay."""
         return float(os.getenv("DISCORD_RATE_LIMIT_DELAY", "2.5"))
-    
-    @property
+
+    @functools.cached_property
     def discord_max_messages_per_batch(self) -> int:
         """Get max messages per batch."""
         return int(os.getenv("DISCORD_MAX_MESSAGES_PER_BATCH", "50"))
-    
-    @property
+
+    @functools.cached_property
     def youtube_rate_limit_delay(self) -> float:
         """Get YouTube rate limit delay."""
         return float(os.getenv("YOUTUBE_RATE_LIMIT_DELAY", "1.0"))
-    
-    @property
-    def youtube_default_languages(self) -> List[str]:
+
+    @functools.cached_property
+    def youtube_default_languages(self) -> tuple[str, ...]:
         """Get default YouTube languages."""
         langs = os.getenv("YOUTUBE_DEFAULT_LANGUAGES", "en,en-US")
-        return [lang.strip() for lang in langs.split(",")]
-    
-    @property
+        return tuple(lang.strip() for lang in langs.split(","))
+
+    @functools.cached_property
     def log_level(self) -> str:
         """Get log level."""
         return os.getenv("LOG_LEVEL", "INFO")
-    
-    @property
+
+    @functools.cached_property
     def log_to_file(self) -> bool:
         """Get whether to log to file."""
         return os.getenv("LOG_TO_FILE", "true").lower() == "true"
-    
-    @property
+
+    @functools.cached_property
     def output_format(self) -> str:
         """Get output format."""
         return os.getenv("OUTPUT_FORMAT", "markdown")
-    
-    @property
+
+    @functools.cached_property
     def include_metadata(self) -> bool:
         """Get whether to include metadata."""
         return os.getenv("INCLUDE_METADATA", "true").lower() == "true"
-    
-    @property
+
+    @functools.cached_property
     def include_attachments(self) -> bool:
         """Get whether to include attachments."""
         return os.getenv("INCLUDE_ATTACHMENTS", "false").lower() == "true"
 
 
-def load_config(config_file: str = "config.yaml") -> tuple[Config, EnvironmentConfig]:
+@functools.lru_cache(maxsize=32)
+def _load_validated(config_path: str, mtime: float) -> dict:
+    """
+    Parse and fully validate a config file once per (path, mtime).
+
+    Returns the validated data as a plain dict so load_config can rebuild
+    models with model_construct() on repeated loads, skipping every validator.
+    """
+    config_data = yaml.load(Path(config_path).read_text(encoding='utf-8'), Loader=_YamlLoader)
+    return Config(**config_data).model_dump()
+
+
+def _construct_config(data: dict) -> Config:
+    """Rebuild a Config tree from already-validated data without revalidating."""
+    return Config.model_construct(
+        discord=DiscordConfig.model_construct(
+            channels=[DiscordChannelConfig.model_construct(**c) for c in data['discord']['channels']]
+        ),
+        youtube=YouTubeConfig.model_construct(
+            videos=[YouTubeVideoConfig.model_construct(**v) for v in data['youtube']['videos']]
+        ),
+        settings=GlobalSettings.model_construct(**data['settings']),
+    )
+
+
+def load_config(config_file: str = "config.yaml", validate: bool = False) -> tuple[Config, EnvironmentConfig]:
     """
     Load configuration from YAML file and environment variables.
-    
+
+    The file is parsed and fully validated once per (path, mtime); repeated
+    loads of an unchanged file rebuild the model tree with model_construct(),
+    skipping the per-field validator/coercion cost.
+
     Args:
         config_file: Path to the YAML configuration file
-        
+        validate: Force a full re-parse and re-validation (e.g. before
+            writing the config back out)
+
     Returns:
         Tuple of (Config, EnvironmentConfig) objects
-        
+
     Raises:
         FileNotFoundError: If config file doesn't exist
         ValueError: If configuration is invalid
@@ -189,16 +273,18 @@ def load_config(config_file: str = "config.yaml") -> tuple[Config, EnvironmentCo
     config_path = Path(config_file)
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_file}")
-    
+
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
-        
-        config = Config(**config_data)
+        if validate:
+            config_data = yaml.load(config_path.read_text(encoding='utf-8'), Loader=_YamlLoader)
+            config = Config(**config_data)
+        else:
+            data = _load_validated(str(config_path), config_path.stat().st_mtime)
+            config = _construct_config(data)
         env_config = EnvironmentConfig()
-        
+
         return config, env_config
-        
+
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in config file: {e}")
     except Exception as e:
@@ -213,7 +299,12 @@ def save_config(config: Config, config_file: str = "config.yaml") -> None:
         config: Configuration object to save
         config_file: Path to save the configuration file
     """
-    config_data = config.dict()
-    
+    config_data = config.model_dump()
+
+    if msgspec is not None:
+        # Single-pass C-level emit, no Python-level YAML representer walk
+        Path(config_file).write_bytes(msgspec.yaml.encode(config_data))
+        return
+
     with open(config_file, 'w', encoding='utf-8') as f:
-        yaml.dump(config_data, f, default_flow_style=False, indent=2) 
\ No newline at end of file
+        yaml.dump(config_data, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
\ No newline at end of file
@@ -3,19 +3,50 @@
 import asyncio
 import logging
 import time
-from datetime import datetime, timezone
+from bisect import bisect_right
+from datetime import date, datetime, timezone
 from typing import Dict, List, Optional, Any
 import json
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import aiohttp
+
+# Fastest available JSON decoder for Discord's payloads: msgspec's C
+# decoder, then orjson, then stdlib json
+try:
+    import msgspec.json
+    _json_loads = msgspec.json.decode
+except ImportError:
+    try:
+        import orjson
+        _json_loads = orjson.loads
+    except ImportError:
+        _json_loads = json.loads
 
 from .config import DiscordChannelConfig
 
 
 logger = logging.getLogger(__name__)
 
+# Markdown escape table: one C-level pass over the content instead of
+# three chained .replace() calls allocating intermediates
+_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '*': '\\*', '_': '\\_'})
+
+# Discord epoch (2015-01-01 00:00:00 UTC) in Unix milliseconds
+_DISCORD_EPOCH_MS = 1420070400000
+
+# date(1970, 1, 1).toordinal(), for integer date -> epoch-ms conversion
+_EPOCH_ORDINAL = 719163
+
+try:
+    # Python 3.11+ fromisoformat parses Discord's trailing 'Z' natively
+    datetime.fromisoformat('1970-01-01T00:00:00Z')
+
+    def _parse_iso(ts: str) -> datetime:
+        return datetime.fromisoformat(ts)
+except ValueError:
+    def _parse_iso(ts: str) -> datetime:
+        return datetime.fromisoformat(ts.replace('Z', '+00:00'))
+
 
 class DiscordClient:
     """
@@ -25,94 +56,156 @@ class DiscordClient:
     This should only be used for personal research and archival purposes.
     """
     
-    def __init__(self, user_token: str, rate_limit_delay: float = 2.5):
+    def __init__(
+        self,
+        user_token: str,
+        rate_limit_delay: float = 2.5,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         """
         Initialize Discord client.
-        
+
         Args:
             user_token: Discord user token
             rate_limit_delay: Delay between requests in seconds (minimum 2.5s recommended)
+            session: Optional shared aiohttp.ClientSession; lets several
+                clients reuse one keep-alive connection pool
         """
         self.user_token = user_token.strip()
         self.rate_limit_delay = max(rate_limit_delay, 2.0)  # Minimum 2 seconds
         self.logger = logging.getLogger(__name__)
-        
-        # Setup session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=2,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        
-        # Set headers
-        self.session.headers.update({
+
+        # The aiohttp session is created lazily on first request so the
+        # client can be constructed outside a running event loop
+        self.session = session
+        # No Content-Type in the defaults: every call here is a body-less
+        # GET. Pass _json_headers explicitly on any future POST/PATCH.
+        self._headers = {
             'Authorization': self.user_token,
-            'Content-Type': 'application/json',
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        
+        }
+        self._json_headers = {'Content-Type': 'application/json'}
+
         self.last_request_time = 0
-    
-    def _date_to_snowflake(self, date_str: str) -> str:
+
+        # Adaptive rate limiting driven by Discord's X-RateLimit-* headers;
+        # until the first response arrives we fall back to the fixed delay.
+        # The lock serializes the gate across concurrent channel captures so
+        # they share one global rate budget.
+        self._seen_ratelimit_headers = False
+        self._next_request_time = 0.0
+        self._rate_lock = asyncio.Lock()
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the shared aiohttp session inside the running event loop."""
+        if self.session is None or self.session.closed:
+            # Pool sized so concurrent channel captures reuse keep-alive
+            # connections instead of queueing
+            connector = aiohttp.TCPConnector(limit=20)
+            self.session = aiohttp.ClientSession(connector=connector, headers=self._headers)
+        return self.session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    def _date_to_snowflake(self, date_str: str, end_of_day: bool = False) -> str:
         """
         Convert date string to Discord snowflake ID for filtering.
-        
+
         Args:
             date_str: Date in YYYY-MM-DD format
-            
+            end_of_day: Use 23:59:59 UTC instead of the start of the day
+                (to include the whole day when used as an upper bound)
+
         Returns:
             Discord snowflake ID as string
         """
         try:
-            # Parse date and set to start of day UTC
-            dt = datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
-            
-            # Discord epoch (2015-01-01 00:00:00 UTC)
-            discord_epoch = datetime(2015, 1, 1, tzinfo=timezone.utc)
-            
-            # Calculate milliseconds since Discord epoch
-            timestamp_ms = int((dt - discord_epoch).total_seconds() * 1000)
-            
+            # Pure integer arithmetic: no datetime/timedelta objects and no
+            # float multiply on the way to the snowflake
+            y, m, d = map(int, date_str.split('-'))
+            timestamp_ms = (date(y, m, d).toordinal() - _EPOCH_ORDINAL) * 86_400_000
+            if end_of_day:
+                timestamp_ms += 86_399_000  # 23:59:59
+
             # Generate snowflake (timestamp << 22)
-            snowflake = timestamp_ms << 22
-            
-            return str(snowflake)
-            
-        except ValueError as e:
+            return str((timestamp_ms - _DISCORD_EPOCH_MS) << 22)
+
+        except (ValueError, TypeError) as e:
             self.logger.error(f"Invalid date format {date_str}: {e}")
             return None
     
     async def _rate_limit(self):
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            await asyncio.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
-    
-    def _make_request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Make HTTP request with error handling."""
+        """Apply rate limiting between requests (shared across concurrent tasks)."""
+        async with self._rate_lock:
+            if self._seen_ratelimit_headers:
+                # Discord told us how much quota is left; only sleep when the
+                # bucket is exhausted instead of a fixed delay per request
+                sleep_time = self._next_request_time - time.monotonic()
+                if sleep_time > 0:
+                    self.logger.debug(f"Rate limiting (bucket exhausted): sleeping for {sleep_time:.2f}s")
+                    await asyncio.sleep(sleep_time)
+            else:
+                current_time = time.time()
+                time_since_last = current_time - self.last_request_time
+
+                if time_since_last < self.rate_limit_delay:
+                    sleep_time = self.rate_limit_delay - time_since_last
+                    self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+                    await asyncio.sleep(sleep_time)
+
+            self.last_request_time = time.time()
+
+    def _update_rate_limit(self, response: aiohttp.ClientResponse):
+        """Track Discord's rate-limit headers from a response."""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset_after = response.headers.get('X-RateLimit-Reset-After')
+
+        if remaining is None or reset_after is None:
+            return
+
+        self._seen_ratelimit_headers = True
+        if remaining == '0':
+            self._next_request_time = time.monotonic() + float(reset_after)
+        else:
+            self._next_request_time = time.monotonic()
+
+    async def _make_request(self, method: str, url: str, **kwargs) -> bytes:
+        """Make an HTTP request with error handling, returning the body bytes."""
+        session = await self._ensure_session()
         try:
-            response = self.session.request(method, url, **kwargs)
-            
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = response.json().get('retry_after', self.rate_limit_delay)
-                self.logger.warning(f"Rate limited. Waiting {retry_after}s")
-                time.sleep(retry_after)
-                return self._make_request(method, url, **kwargs)
-            
+            # One bounded retry loop for both rate limits and transient
+            # server errors: predictable worst-case latency, no stack growth
+            for attempt in range(5):
+                async with session.request(method, url, **kwargs) as response:
+                    self._update_rate_limit(response)
+
+                    # Handle rate limiting (prefer the Retry-After header
+                    # over re-parsing the JSON body)
+                    if response.status == 429:
+                        retry_after = response.headers.get('Retry-After')
+                        if retry_after is None:
+                            body = await response.read()
+                            retry_after = _json_loads(body).get('retry_after', self.rate_limit_delay)
+                        self.logger.warning(f"Rate limited. Waiting {retry_after}s")
+                        await asyncio.sleep(float(retry_after))
+                        continue
+
+                    if response.status >= 500:
+                        backoff = 2 ** attempt
+                        self.logger.warning(f"Server error {response.status}, retrying in {backoff}s")
+                        await asyncio.sleep(backoff)
+                        continue
+
+                    response.raise_for_status()
+                    return await response.read()
+
+            # Out of attempts: the last response was a 429/5xx, so this raises
             response.raise_for_status()
-            return response
-            
-        except requests.exceptions.RequestException as e:
+
+        except aiohttp.ClientError as e:
             self.logger.error(f"Request failed: {e}")
             raise
     
@@ -121,8 +214,8 @@ class DiscordClient:
         await self._rate_limit()
         
         try:
-            response = self._make_request('GET', 'https://discord.com/api/v9/users/@me')
-            user_data = response.json()
+            body = await self._make_request('GET', 'https://discord.com/api/v9/users/@me')
+            user_data = _json_loads(body)
             
             return {
                 'success': True,
@@ -144,8 +237,8 @@ class DiscordClient:
         
         try:
             url = f'https://discord.com/api/v9/channels/{channel_id}'
-            response = self._make_request('GET', url)
-            channel_data = response.json()
+            body = await self._make_request('GET', url)
+            channel_data = _json_loads(body)
             
             return {
                 'success': True,
@@ -177,9 +270,10 @@ class DiscordClient:
             limit: Number of messages to fetch (max 100)
             before: Message ID to fetch messages before
             after: Message ID to fetch messages after
-            
+
         Returns:
-            List of message dictionaries
+            List of raw Discord message dictionaries, each annotated with a
+            pre-rendered '_time_str'
         """
         await self._rate_limit()
         
@@ -195,148 +289,178 @@ class DiscordClient:
             if after:
                 params['after'] = after
             
-            response = self._make_request('GET', url, params=params)
-            messages = response.json()
-            
-            # Process messages
-            processed_messages = []
+            body = await self._make_request('GET', url, params=params)
+            messages = _json_loads(body)
+
+            # Return the raw Discord payload: pagination only needs 'id' and
+            # the formatter reads raw keys directly, so reshaping every
+            # message into an intermediate dict was pure allocation overhead.
+            # Only the rendered timestamp is annotated in place (parsed once
+            # here instead of on every render).
             for msg in messages:
-                processed_msg = {
-                    'id': msg.get('id'),
-                    'content': msg.get('content', ''),
-                    'timestamp': msg.get('timestamp'),
-                    'author': {
-                        'id': msg.get('author', {}).get('id'),
-                        'username': msg.get('author', {}).get('username'),
-                        'discriminator': msg.get('author', {}).get('discriminator'),
-                        'bot': msg.get('author', {}).get('bot', False)
-                    },
-                    'attachments': [
-                        {
-                            'filename': att.get('filename'),
-                            'url': att.get('url'),
-                            'size': att.get('size')
-                        }
-                        for att in msg.get('attachments', [])
-                    ],
-                    'embeds': msg.get('embeds', []),
-                    'reactions': msg.get('reactions', []),
-                    'edited_timestamp': msg.get('edited_timestamp'),
-                    'channel_id': channel_id
-                }
-                processed_messages.append(processed_msg)
-            
-            self.logger.info(f"Retrieved {len(processed_messages)} messages from channel {channel_id}")
-            return processed_messages
+                ts = msg.get('timestamp')
+                if ts:
+                    msg['_time_str'] = _parse_iso(ts).strftime('%Y-%m-%d %H:%M:%S UTC')
+
+            self.logger.info(f"Retrieved {len(messages)} messages from channel {channel_id}")
+            return messages
             
         except Exception as e:
             self.logger.error(f"Failed to get messages from channel {channel_id}: {e}")
             return []
     
-    async def get_messages_batch(
-        self, 
-        channel_id: str, 
+    async def iter_messages_batch(
+        self,
+        channel_id: str,
         total_limit: int = None,
         batch_size: int = 50,
         after_date: str = None,
-        before_date: str = None
-    ) -> List[Dict[str, Any]]:
+        before_date: str = None,
+        after_id: str = None
+    ):
         """
-        Get multiple batches of messages from a channel with optional date filtering.
-        
+        Stream batches of messages from a channel with optional date filtering.
+
+        Yields each fetched batch (newest first, as Discord paginates) as soon
+        as it arrives, so callers can overlap formatting/writing with the next
+        network fetch instead of waiting for the full history.
+
         Args:
             channel_id: Channel ID to fetch from
             total_limit: Total number of messages to fetch (None for unlimited within date range)
             batch_size: Messages per batch (max 100)
             after_date: Only fetch messages after this date (YYYY-MM-DD format)
             before_date: Only fetch messages before this date (YYYY-MM-DD format)
-            
-        Returns:
-            List of all fetched messages
+            after_id: Only fetch messages newer than this message ID (for
+                delta captures; takes precedence over after_date)
+
+        Yields:
+            Lists of message dictionaries, one per fetched batch
         """
-        all_messages = []
+        fetched_count = 0
         batch_size = min(batch_size, 100)
         before_id = None
-        
+
         # Convert dates to snowflakes for filtering
         after_snowflake = None
         before_snowflake = None
-        
-        if after_date:
+
+        if after_id:
+            # Local cutoff only (never sent to the API): +1 makes the
+            # bisect_right prefix below strictly exclude the already
+            # captured message itself
+            after_snowflake = str(int(after_id) + 1)
+        elif after_date:
             after_snowflake = self._date_to_snowflake(after_date)
             if not after_snowflake:
                 self.logger.error(f"Invalid after_date: {after_date}")
-                return []
-        
+                return
+
         if before_date:
-            # Add one day to before_date to include the entire day
-            try:
-                before_dt = datetime.strptime(before_date, '%Y-%m-%d')
-                before_dt = before_dt.replace(hour=23, minute=59, second=59, tzinfo=timezone.utc)
-                discord_epoch = datetime(2015, 1, 1, tzinfo=timezone.utc)
-                timestamp_ms = int((before_dt - discord_epoch).total_seconds() * 1000)
-                before_snowflake = str(timestamp_ms << 22)
-            except ValueError:
+            # End-of-day snowflake so the entire before_date day is included
+            before_snowflake = self._date_to_snowflake(before_date, end_of_day=True)
+            if not before_snowflake:
                 self.logger.error(f"Invalid before_date: {before_date}")
-                return []
-        
+                return
+
         self.logger.info(f"Fetching messages from {after_date or 'beginning'} to {before_date or 'now'}")
-        
+
+        # Parse the cutoff once instead of per message in the filter below
+        after_int = int(after_snowflake) if after_snowflake else None
+
         while True:
             # Determine current batch size
             if total_limit and total_limit > 0:
-                remaining = total_limit - len(all_messages)
+                remaining = total_limit - fetched_count
                 if remaining <= 0:
                     break
                 current_batch_size = min(batch_size, remaining)
             else:
                 current_batch_size = batch_size
-            
-            # Determine after parameter (use after_snowflake for first request, then last message ID)
-            after_param = after_snowflake if len(all_messages) == 0 and after_snowflake else None
-            
+
+            # Never pass `after` to the API: Discord's `after` pages start at
+            # the oldest new messages, which would break the newest-first walk
+            # (and the batch[0]-is-newest assumption downstream) after one
+            # batch. Instead paginate newest-first with `before` and let the
+            # snowflake cutoff below terminate the walk.
             messages = await self.get_messages(
                 channel_id=channel_id,
                 limit=current_batch_size,
-                before=before_id,
-                after=after_param
+                before=before_id
             )
-            
+
             if not messages:
                 self.logger.info("No more messages found, stopping")
                 break
-            
-            # Filter messages by date if after_date is specified
-            if after_snowflake:
-                filtered_messages = []
-                for msg in messages:
-                    if int(msg['id']) >= int(after_snowflake):
-                        filtered_messages.append(msg)
-                    else:
-                        # We've reached messages older than our after_date, stop
-                        self.logger.info(f"Reached messages older than {after_date}, stopping pagination")
-                        if filtered_messages:
-                            all_messages.extend(filtered_messages)
-                        return all_messages
-                messages = filtered_messages
-            
-            if not messages:
-                self.logger.info("No messages after date filtering, stopping")
-                break
-            
-            all_messages.extend(messages)
+
+            # Filter messages by the cutoff if after_date/after_id is specified
+            if after_int is not None:
+                # Batches arrive in descending snowflake order, so messages
+                # newer than the cutoff form a prefix; binary-search its end
+                # on the negated (hence ascending) IDs
+                neg_ids = [-int(msg['id']) for msg in messages]
+                cut = bisect_right(neg_ids, -after_int)
+                if cut < len(messages):
+                    # We've reached messages older than our cutoff, stop
+                    self.logger.info(
+                        f"Reached messages older than {after_date or f'message {after_id}'}, "
+                        "stopping pagination"
+                    )
+                    if cut:
+                        yield messages[:cut]
+                    return
+
+            fetched_count += len(messages)
             before_id = messages[-1]['id']  # Last message ID for pagination
-            
-            self.logger.info(f"Fetched batch: {len(messages)} messages. Total: {len(all_messages)}")
-            
+
+            self.logger.info(f"Fetched batch: {len(messages)} messages. Total: {fetched_count}")
+
+            yield messages
+
             # Extra safety delay between batches
             await asyncio.sleep(1.0)
-            
+
             # If we got fewer messages than requested, we've reached the end
             if len(messages) < current_batch_size:
                 self.logger.info("Reached end of channel history (partial batch)")
                 break
-        
+
+    async def get_messages_batch(
+        self,
+        channel_id: str,
+        total_limit: int = None,
+        batch_size: int = 50,
+        after_date: str = None,
+        before_date: str = None,
+        after_id: str = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get multiple batches of messages from a channel with optional date filtering.
+
+        Convenience wrapper around iter_messages_batch for callers that want
+        the whole history as one list.
+
+        Args:
+            channel_id: Channel ID to fetch from
+            total_limit: Total number of messages to fetch (None for unlimited within date range)
+            batch_size: Messages per batch (max 100)
+            after_date: Only fetch messages after this date (YYYY-MM-DD format)
+            before_date: Only fetch messages before this date (YYYY-MM-DD format)
+            after_id: Only fetch messages newer than this message ID
+
+        Returns:
+            List of all fetched messages
+        """
+        all_messages = []
+        async for batch in self.iter_messages_batch(
+            channel_id=channel_id,
+            total_limit=total_limit,
+            batch_size=batch_size,
+            after_date=after_date,
+            before_date=before_date,
+            after_id=after_id
+        ):
+            all_messages.extend(batch)
         return all_messages
     
     def format_messages_markdown(self, messages: List[Dict[str, Any]], channel_info: Dict[str, Any] = None) -> str:
@@ -350,65 +474,105 @@ class DiscordClient:
         Returns:
             Formatted Markdown string
         """
+        return "".join(self.format_messages_markdown_iter(messages, channel_info))
+
+    def format_messages_markdown_iter(self, messages: List[Dict[str, Any]], channel_info: Dict[str, Any] = None):
+        """
+        Format Discord messages as Markdown, yielding message-sized chunks.
+
+        Streaming variant of format_messages_markdown: callers can write
+        chunks to disk as they are produced instead of materializing the
+        whole document (megabytes for 3000-message channels) in memory.
+
+        Args:
+            messages: List of message dictionaries
+            channel_info: Optional channel information
+
+        Yields:
+            Markdown string chunks (header first, then one per message)
+        """
         if not messages:
-            return "# Discord Messages\n\nNo messages found.\n"
-        
-        # Sort messages by timestamp (oldest first)
-        sorted_messages = sorted(messages, key=lambda x: x['timestamp'])
-        
+            yield "# Discord Messages\n\nNo messages found.\n"
+            return
+
+        # Sort by snowflake ID (oldest first): the ID's high bits encode the
+        # timestamp, and int compares are cheaper than ISO-string compares
+        sorted_messages = sorted(messages, key=lambda m: int(m['id']))
+
+        yield self.format_header_markdown(len(sorted_messages), channel_info)
+
+        for msg in sorted_messages:
+            chunk = self._format_message_markdown(msg)
+            if chunk:
+                yield chunk
+
+    def format_header_markdown(self, message_count: int, channel_info: Dict[str, Any] = None) -> str:
+        """Format the capture-file header as Markdown."""
         markdown = f"# Discord Messages\n\n"
-        
+
         if channel_info:
             markdown += f"**Channel:** #{channel_info.get('name', 'Unknown')}\n"
             markdown += f"**Channel ID:** {channel_info.get('channel_id', 'Unknown')}\n"
             if channel_info.get('topic'):
                 markdown += f"**Topic:** {channel_info['topic']}\n"
-        
-        markdown += f"**Messages:** {len(sorted_messages)}\n"
+
+        markdown += f"**Messages:** {message_count}\n"
         markdown += f"**Captured:** {datetime.now().isoformat()}\n\n"
         markdown += "---\n\n"
-        
-        for msg in sorted_messages:
-            # Parse timestamp
-            timestamp = msg['timestamp']
-            if timestamp:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                time_str = dt.strftime('%Y-%m-%d %H:%M:%S UTC')
-            else:
-                time_str = 'Unknown time'
-            
-            # Author info
-            author = msg['author']
-            author_name = f"{author['username']}"
-            if author['discriminator'] and author['discriminator'] != '0':
-                author_name += f"#{author['discriminator']}"
-            if author['bot']:
-                author_name += " [BOT]"
-            
-            # Message content
-            content = msg['content'].strip()
-            if not content and not msg['attachments'] and not msg['embeds']:
-                continue  # Skip empty messages
-            
-            markdown += f"**[{time_str}]** **{author_name}:**\n"
-            
-            if content:
-                # Simple markdown escaping
-                content = content.replace('\\', '\\\\').replace('*', '\\*').replace('_', '\\_')
-                markdown += f"{content}\n"
-            
-            # Attachments
-            if msg['attachments']:
-                markdown += "\n*Attachments:*\n"
-                for att in msg['attachments']:
-                    markdown += f"- [{att['filename']}]({att['url']}) ({att['size']} bytes)\n"
-            
-            # Embeds (simplified)
-            if msg['embeds']:
-                markdown += f"\n*Embeds: {len(msg['embeds'])} embed(s)*\n"
-            
-            markdown += "\n"
-        
+
+        return markdown
+
+    def format_batch_markdown(self, batch: List[Dict[str, Any]]) -> str:
+        """
+        Format one fetched batch as Markdown, oldest message first.
+
+        Discord returns each batch newest-first and batches paginate
+        backwards in time, so reversing within the batch keeps each chunk
+        chronological; callers streaming batches to a chronological file
+        should write the chunks in reverse batch order.
+        """
+        return "".join(self._format_message_markdown(msg) for msg in reversed(batch))
+
+    def _format_message_markdown(self, msg: Dict[str, Any]) -> str:
+        """Format a single message as Markdown ('' for empty messages)."""
+        # Timestamp was pre-parsed once in get_messages
+        time_str = msg.get('_time_str', 'Unknown time')
+
+        # Author info (raw Discord JSON; 'bot' is only present for bots)
+        author = msg.get('author') or {}
+        author_name = f"{author.get('username', 'Unknown')}"
+        discriminator = author.get('discriminator')
+        if discriminator and discriminator != '0':
+            author_name += f"#{discriminator}"
+        if author.get('bot'):
+            author_name += " [BOT]"
+
+        # Message content
+        content = msg.get('content', '').strip()
+        attachments = msg.get('attachments')
+        embeds = msg.get('embeds')
+        if not content and not attachments and not embeds:
+            return ""  # Skip empty messages
+
+        markdown = f"**[{time_str}]** **{author_name}:**\n"
+
+        if content:
+            # Simple markdown escaping
+            content = content.translate(_ESCAPE_TABLE)
+            markdown += f"{content}\n"
+
+        # Attachments
+        if attachments:
+            markdown += "\n*Attachments:*\n"
+            for att in attachments:
+                markdown += f"- [{att.get('filename')}]({att.get('url')}) ({att.get('size')} bytes)\n"
+
+        # Embeds (simplified)
+        if embeds:
+            markdown += f"\n*Embeds: {len(embeds)} embed(s)*\n"
+
+        markdown += "\n"
+
         return markdown
     
     async def capture_channel(self, channel_config: DiscordChannelConfig) -> Dict[str, Any]:
@@ -459,4 +623,30 @@ class DiscordClient:
                 'status': 'error',
                 'error': str(e),
                 'channel_config': channel_config
-            } 
\ No newline at end of file
+            }
+
+    async def capture_channels(
+        self,
+        channel_configs: List[DiscordChannelConfig],
+        concurrency: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Capture several channels concurrently with bounded parallelism.
+
+        Network waits and rate-limit sleeps overlap across channels while
+        the shared rate-limit gate keeps the global request budget intact.
+
+        Args:
+            channel_configs: Channel configuration objects
+            concurrency: Maximum number of channels captured at once
+
+        Returns:
+            List of capture result dictionaries, in input order
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(channel_config: DiscordChannelConfig) -> Dict[str, Any]:
+            async with sem:
+                return await self.capture_channel(channel_config)
+
+        return list(await asyncio.gather(*map(_one, channel_configs)))
\ No newline at end of file
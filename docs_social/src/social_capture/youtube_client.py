@@ -1,8 +1,12 @@
 """YouTube transcript extraction client."""
 
 import asyncio
+import functools
 import logging
 import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pathlib import Path
@@ -17,23 +21,115 @@ from youtube_transcript_api._errors import (
 
 from .config import YouTubeVideoConfig
 
+try:
+    # Optional: vectorized paragraph-boundary detection for long transcripts
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # Optional: C-level JSON encoder for transcript export
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: msgspec's C JSON encoder, used when orjson is absent
+    import msgspec.json
+except ImportError:
+    msgspec = None
+
 
 logger = logging.getLogger(__name__)
 
+# One alternation covering every supported URL shape, compiled once at
+# import: the engine scans the URL a single time instead of once per
+# pattern. Each alternative is a specific anchored prefix — no catch-all
+# '/' — so garbage paths fail fast instead of backtracking.
+_VIDEO_ID_RE = re.compile(r'(?:[?&]v=|embed\/|shorts\/|youtu\.be\/|\/v\/)([0-9A-Za-z_-]{11})')
+
+# Valid video-ID alphabet for the string fast path below
+_ID_CHARS = frozenset('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_-')
+
+
+# Transcript cache bounds: transcripts are effectively immutable, so a
+# long TTL is safe
+_CACHE_MAX_ENTRIES = 1024
+_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+
+@functools.lru_cache(maxsize=8192)
+def _format_timestamp_cached(seconds: int) -> str:
+    """Render an integer second count as MM:SS (memoized; shared by all clients)."""
+    return "%02d:%02d" % divmod(seconds, 60)
+
+
+def _write_file(path: Path, data, binary: bool = False) -> None:
+    """Blocking write helper; callers run it off the loop via asyncio.to_thread."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if binary:
+        path.write_bytes(data)
+    else:
+        path.write_text(data, encoding='utf-8')
+
+
+def _write_chunks(path: Path, chunks) -> None:
+    """Blocking chunked-write helper; streams an iterable of str to disk."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Binary mode: each chunk gets one contiguous C-level UTF-8 encode
+    # instead of trickling through the text layer's incremental codec
+    with open(path, 'wb') as f:
+        for chunk in chunks:
+            f.write(chunk.encode('utf-8'))
+
 
 class YouTubeClient:
     """Client for extracting YouTube video transcripts."""
     
-    def __init__(self, rate_limit_delay: float = 1.0):
+    def __init__(self, rate_limit_delay: float = 1.0, max_concurrent: int = 8):
         """
         Initialize YouTube client.
-        
+
         Args:
-            rate_limit_delay: Delay between API requests in seconds
+            rate_limit_delay: Minimum spacing between API requests in seconds
+            max_concurrent: Maximum transcript fetches in flight at once
         """
         self.rate_limit_delay = rate_limit_delay
         self.logger = logging.getLogger(__name__)
-    
+
+        # Token-bucket rate gate: a lone request proceeds immediately and
+        # only sustained traffic spaces out by rate_limit_delay, instead of
+        # an unconditional sleep after every fetch
+        self._gate = asyncio.Semaphore(max_concurrent)
+        self._next_slot = 0.0
+        self._slot_lock = asyncio.Lock()
+
+        # LRU transcript cache keyed by (video_id, languages): a repeat
+        # fetch within the TTL is a dict lookup instead of a network RPC.
+        # _inflight coalesces concurrent requests for the same key.
+        self._cache: OrderedDict = OrderedDict()
+        self._inflight: Dict[Any, asyncio.Future] = {}
+
+        # One API object and one thread pool for the whole client: fetches
+        # are blocking network RPCs, so running them in the pool lets
+        # asyncio.gather overlap several transcripts
+        self._api = YouTubeTranscriptApi()
+        self._executor = ThreadPoolExecutor(max_workers=8)
+
+    async def aclose(self) -> None:
+        """Shut down the fetch thread pool."""
+        self._executor.shutdown(wait=False)
+
+    async def _acquire_slot(self) -> None:
+        """Wait for the next rate-limit slot (token bucket shared per client)."""
+        loop = asyncio.get_running_loop()
+        async with self._slot_lock:
+            now = loop.time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.rate_limit_delay
+        if wait > 0:
+            await asyncio.sleep(wait)
+
     def extract_video_id(self, url: str) -> Optional[str]:
         """
         Extract video ID from YouTube URL.
@@ -44,18 +140,18 @@ class YouTubeClient:
         Returns:
             Video ID or None if invalid URL
         """
-        patterns = [
-            r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-            r'(?:embed\/)([0-9A-Za-z_-]{11})',
-            r'(?:watch\?v=)([0-9A-Za-z_-]{11})'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        return None
+        # Fast path: the common '?v=<id>' and 'youtu.be/<id>' shapes resolve
+        # with a C-level find + slice, no regex machinery at all
+        for marker, offset in (('v=', 2), ('youtu.be/', 9)):
+            i = url.find(marker)
+            if i >= 0:
+                candidate = url[i + offset:i + offset + 11]
+                if len(candidate) == 11 and _ID_CHARS.issuperset(candidate):
+                    return candidate
+
+        # Unusual shapes (embeds etc.) fall back to the compiled regex
+        match = _VIDEO_ID_RE.search(url)
+        return match.group(1) if match else None
     
     async def get_transcript(
         self, 
@@ -70,7 +166,8 @@ class YouTubeClient:
             languages: Preferred languages (defaults to ['en'])
             
         Returns:
-            Dictionary containing transcript data and metadata
+            Dictionary containing metadata and a columnar 'transcript'
+            (parallel 'text'/'start'/'duration' lists)
         """
         if languages is None:
             languages = ['en']
@@ -78,99 +175,206 @@ class YouTubeClient:
         video_id = self.extract_video_id(video_url)
         if not video_id:
             raise ValueError(f"Invalid YouTube URL: {video_url}")
-        
+
+        cache_key = (video_id, tuple(languages))
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            cached_at, data = cached
+            if time.monotonic() - cached_at < _CACHE_TTL_SECONDS:
+                self._cache.move_to_end(cache_key)
+                return data
+            del self._cache[cache_key]
+
+        # Single-flight: if another coroutine is already fetching this exact
+        # transcript, ride on its future instead of issuing a duplicate RPC
+        fut = self._inflight.get(cache_key)
+        if fut is not None:
+            return await fut
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = fut
+
         try:
-            # Use the correct API method
-            api = YouTubeTranscriptApi()
-            fetched_transcript = api.fetch(video_id, languages=languages)
-            
-            # Convert FetchedTranscriptSnippet objects to dictionaries
-            transcript_data = []
-            for snippet in fetched_transcript:
-                transcript_data.append({
-                    'text': snippet.text,
-                    'start': snippet.start,
-                    'duration': snippet.duration
-                })
-            
-            # Apply rate limiting
-            await asyncio.sleep(self.rate_limit_delay)
-            
-            return {
-                'video_id': video_id,
-                'video_url': video_url,
-                'language': languages[0],  # Default to first requested language
-                'language_code': languages[0],
-                'transcript': transcript_data,
-                'fetched_at': datetime.now().isoformat(),
-                'total_segments': len(transcript_data)
-            }
-            
-        except (TranscriptsDisabled, NoTranscriptFound, VideoUnavailable) as e:
-            raise Exception(f"Failed to get transcript for {video_id}: {str(e)}")
+            try:
+                # The fetch is a blocking network RPC; run it in the shared
+                # pool so the event loop stays free for concurrent requests
+                async with self._gate:
+                    await self._acquire_slot()
+                    fetched_transcript = await asyncio.get_running_loop().run_in_executor(
+                        self._executor,
+                        functools.partial(self._api.fetch, video_id, languages=languages)
+                    )
+
+                # Columnar (SoA) layout: the raw snippets are drained
+                # straight into three parallel lists — no intermediate
+                # per-snippet dicts are ever materialized, and the formatter
+                # walks each column contiguously
+                texts = [snippet.text for snippet in fetched_transcript]
+                starts = [snippet.start for snippet in fetched_transcript]
+                durations = [snippet.duration for snippet in fetched_transcript]
+
+                lang0 = languages[0]  # Default to first requested language
+                result = {
+                    'video_id': video_id,
+                    'video_url': video_url,
+                    'language': lang0,
+                    'language_code': lang0,
+                    'transcript': {'text': texts, 'start': starts, 'duration': durations},
+                    'fetched_at': datetime.now().isoformat(),
+                    'total_segments': len(texts)
+                }
+
+                self._cache[cache_key] = (time.monotonic(), result)
+                while len(self._cache) > _CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+
+            except (TranscriptsDisabled, NoTranscriptFound, VideoUnavailable) as e:
+                raise Exception(f"Failed to get transcript for {video_id}: {str(e)}")
+
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved in case no one was waiting
+            raise
+        finally:
+            self._inflight.pop(cache_key, None)
+
+        fut.set_result(result)
+        return result
+
+    def _export_json(self, transcript_data: Dict[str, Any], output_path: Path) -> None:
+        """Serialize and write a transcript as JSON (blocking; run off-loop)."""
+        # Re-zip the columnar transcript so exported JSON keeps the
+        # row-per-segment shape external consumers expect
+        t = transcript_data['transcript']
+        export = dict(transcript_data)
+        export['transcript'] = [
+            {'text': text, 'start': start, 'duration': duration}
+            for text, start, duration in zip(t['text'], t['start'], t['duration'])
+        ]
+        if orjson is not None:
+            # orjson emits UTF-8 bytes directly — no encode pass
+            data = orjson.dumps(export, option=orjson.OPT_INDENT_2)
+        elif msgspec is not None:
+            # msgspec's C encoder, reformatted to keep the indented layout
+            data = msgspec.json.format(msgspec.json.encode(export), indent=2)
+        else:
+            import json
+            data = json.dumps(export, indent=2, ensure_ascii=False).encode('utf-8')
+        _write_file(output_path, data, binary=True)
+
+    def invalidate(self, video_id: str) -> None:
+        """Drop any cached transcripts for a video (all language variants)."""
+        for key in [k for k in self._cache if k[0] == video_id]:
+            del self._cache[key]
     
     def format_transcript_markdown(self, transcript_data: Dict[str, Any]) -> str:
         """
         Format transcript data as Markdown.
-        
+
         Args:
             transcript_data: Transcript data from get_transcript()
-            
+
         Returns:
             Formatted Markdown string
         """
-        video_info = transcript_data
-        transcript = video_info['transcript']
-        
-        markdown = f"""# YouTube Transcript
+        return ''.join(self.iter_transcript_markdown(transcript_data))
+
+    def iter_transcript_markdown(self, transcript_data: Dict[str, Any]):
+        """
+        Format transcript data as Markdown, yielding paragraph-sized chunks.
+
+        Streaming variant of format_transcript_markdown: callers can write
+        chunks to disk as they are produced, so peak memory stays at one
+        paragraph instead of the whole document.
+
+        Args:
+            transcript_data: Transcript data from get_transcript()
 
-**Video ID:** {video_info['video_id']}  
-**URL:** {video_info['video_url']}  
-**Language:** {video_info['language']} ({video_info['language_code']})  
-**Fetched:** {video_info['fetched_at']}  
-**Total Segments:** {video_info['total_segments']}  
+        Yields:
+            Markdown string chunks (header first, then one per paragraph)
+        """
+        # Bind each field once instead of hashing into the dict per access
+        transcript = transcript_data['transcript']
+        video_id = transcript_data['video_id']
+        video_url = transcript_data['video_url']
+        language = transcript_data['language']
+        language_code = transcript_data['language_code']
+        fetched_at = transcript_data['fetched_at']
+        total_segments = transcript_data['total_segments']
+
+        yield f"""# YouTube Transcript
+
+**Video ID:** {video_id}  
+**URL:** {video_url}  
+**Language:** {language} ({language_code})  
+**Fetched:** {fetched_at}  
+**Total Segments:** {total_segments}  
 
 ---
 
 ## Transcript
 
 """
-        
-        current_text = []
-        current_start = None
-        
-        for segment in transcript:
-            start_time = segment['start']
-            duration = segment['duration']
-            text = segment['text'].strip()
-            
-            if current_start is None:
-                current_start = start_time
-            
-            current_text.append(text)
-            
-            # Group segments into paragraphs (every ~30 seconds or on long pauses)
-            if (start_time - current_start > 30) or (duration > 3):
-                if current_text:
-                    timestamp = self._format_timestamp(current_start)
-                    paragraph = ' '.join(current_text)
-                    markdown += f"**[{timestamp}]** {paragraph}\n\n"
-                    current_text = []
-                    current_start = None
-        
-        # Add any remaining text
-        if current_text:
-            timestamp = self._format_timestamp(current_start or 0)
-            paragraph = ' '.join(current_text)
-            markdown += f"**[{timestamp}]** {paragraph}\n\n"
-        
-        return markdown
+
+        texts = transcript['text']
+        starts = transcript['start']
+
+        for a, b in self._iter_paragraph_bounds(transcript):
+            timestamp = self._format_timestamp(starts[a])
+            paragraph = ' '.join(t.strip() for t in texts[a:b + 1])
+            yield f"**[{timestamp}]** {paragraph}\n\n"
+
+    def _iter_paragraph_bounds(self, transcript: Dict[str, List[Any]]):
+        """
+        Yield inclusive (first, last) segment indices for each paragraph.
+
+        A paragraph ends at the first segment that is more than 30s past the
+        paragraph's first segment or that lasts more than 3s. With numpy
+        available, boundaries come from vectorized comparisons plus binary
+        searches — O(paragraphs x log n) instead of a per-segment Python
+        loop; without it, a plain walk gives identical groups.
+
+        Args:
+            transcript: Columnar transcript with 'start' and 'duration' lists
+
+        Yields:
+            (first_index, last_index) tuples, both inclusive
+        """
+        starts = transcript['start']
+        durations = transcript['duration']
+        n = len(starts)
+        if not n:
+            return
+
+        if np is not None:
+            starts_arr = np.asarray(starts, dtype=np.float64)
+            dur_breaks = np.flatnonzero(np.asarray(durations, dtype=np.float64) > 3)
+
+            i = 0
+            while i < n:
+                # First long-duration segment at or after i
+                pos = np.searchsorted(dur_breaks, i)
+                j_dur = int(dur_breaks[pos]) if pos < len(dur_breaks) else n - 1
+                # First segment past the 30s window (included in the flush)
+                j_time = int(np.searchsorted(starts_arr, starts_arr[i] + 30, side='right'))
+                b = min(j_dur, j_time, n - 1)
+                yield i, b
+                i = b + 1
+        else:
+            i = 0
+            while i < n:
+                group_start = starts[i]
+                b = i
+                while b < n - 1:
+                    if durations[b] > 3 or starts[b] - group_start > 30:
+                        break
+                    b += 1
+                yield i, b
+                i = b + 1
     
     def _format_timestamp(self, seconds: float) -> str:
         """Format seconds as MM:SS timestamp."""
-        minutes = int(seconds // 60)
-        seconds = int(seconds % 60)
-        return f"{minutes:02d}:{seconds:02d}"
+        return _format_timestamp_cached(int(seconds))
     
     async def save_transcript(
         self, 
@@ -193,17 +397,20 @@ class YouTubeClient:
         """
         try:
             transcript_data = await self.get_transcript(video_url, languages)
-            
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
+
+            # Write (mkdir included) off the event loop so concurrent
+            # transcript fetches aren't stalled by disk I/O
+            # Formatting is CPU-bound string work, so it runs in the worker
+            # thread along with the write instead of on the event loop
             if format_type == "markdown":
-                content = self.format_transcript_markdown(transcript_data)
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                # Stream paragraph chunks straight to disk rather than
+                # materializing the full document first (the generator is
+                # consumed inside the worker thread)
+                await asyncio.to_thread(
+                    _write_chunks, output_path, self.iter_transcript_markdown(transcript_data)
+                )
             else:  # json
-                import json
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(transcript_data, f, indent=2, ensure_ascii=False)
+                await asyncio.to_thread(self._export_json, transcript_data, output_path)
             
             self.logger.info(f"Saved transcript to {output_path}")
             return True